@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 """Audiobookshelf Sync plugin for calibre"""
 
+import io
+import csv
+import traceback
 import json
 import time
+from collections import namedtuple
+import threading
+from bisect import bisect_left
+from itertools import groupby
+from functools import reduce, lru_cache
+from operator import getitem
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPSConnection, HTTPException, RemoteDisconnected
 from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
 import urllib.parse
 
 from PyQt5.Qt import (
@@ -17,6 +27,10 @@ from PyQt5.Qt import (
     QVBoxLayout,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
+    QAbstractTableModel,
+    QSortFilterProxyModel,
+    QModelIndex,
     QScrollArea,
     QTimer,
     QTime,
@@ -45,6 +59,8 @@ from calibre_plugins.audiobookshelf import DEBUG
 __license__ = 'GNU GPLv3'
 __copyright__ = '2025, jbhul'
 
+API_CACHE_TTL = 60  # Seconds a GET response is reused for, so back-to-back actions don't refetch the library
+
 # Helper functions to show error and info messages using MessageBox
 def show_error(gui, title, message):
     MessageBox(MessageBox.ERROR, title, message, parent=gui).exec_()
@@ -52,6 +68,32 @@ def show_error(gui, title, message):
 def show_info(gui, title, message):
     MessageBox(MessageBox.INFO, title, message, parent=gui).exec_()
 
+# Plugin resources are read out of the plugin zip, so load each only once
+@lru_cache(maxsize=None)
+def abs_icon():
+    return get_icons('images/abs_icon.png')
+
+@lru_cache(maxsize=None)
+def about_text():
+    return get_resources('about.txt').decode('utf-8')
+
+# An "old >> new" entry in a results table, only formatted into a string if it is displayed or copied
+class ValueChange(namedtuple('ValueChange', ('old', 'new'))):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.old if self.old is not None else '-'} >> {self.new}"
+
+# Build an accessor for a fixed data_location, equivalent to get_nested_value(data, path) but walked in C by reduce
+def nested_getter(path):
+    path = tuple(path)
+    def getter(data):
+        try:
+            return reduce(getitem, path, data)
+        except (KeyError, TypeError):
+            return None
+    return getter
+
 class AudiobookshelfAction(InterfaceAction):
     name = "Audiobookshelf"
     action_spec = (name, 'diff.png', 'Get metadata from Audiobookshelf', None)
@@ -69,8 +111,13 @@ class AudiobookshelfAction(InterfaceAction):
     def genesis(self):
         base = self.interface_action_base_plugin
         self.version = f'{base.name} (v{".".join(map(str, base.version))})'
+        # Pool of idle keep-alive connections to the Audiobookshelf server, keyed by (scheme, host)
+        self._http_pool = {}
+        self._http_lock = threading.Lock()
+        # Recent GET responses, keyed by (url, api_key) with values of (expiry, payload)
+        self._api_cache = {}
         # Set up toolbar button icon and left-click action
-        self.qaction.setIcon(get_icons('images/abs_icon.png'))
+        self.qaction.setIcon(abs_icon())
         self.qaction.triggered.connect(self.sync_from_audiobookshelf)
         # Right-click menu (already includes left-click action)
         menu = self.qaction.menu()
@@ -163,7 +210,7 @@ class AudiobookshelfAction(InterfaceAction):
         open_url('https://github.com/jbhul/Audiobookshelf-calibre-plugin#readme')
 
     def show_about(self):
-        text = get_resources('about.txt').decode('utf-8')
+        text = about_text()
         if DEBUG:
             text += '\n\nRunning in debug mode'
         about_dialog = MessageBox(
@@ -171,7 +218,7 @@ class AudiobookshelfAction(InterfaceAction):
             f'About {self.version}',
             text,
             det_msg='',
-            q_icon=get_icons('images/abs_icon.png'),
+            q_icon=abs_icon(),
             show_copy_button=False,
             parent=None,
         )
@@ -187,7 +234,7 @@ class AudiobookshelfAction(InterfaceAction):
         # Get all linked ABS IDs from Calibre
         db = self.gui.current_db.new_api
         all_book_ids = db.search('identifiers:"=audiobookshelf_id:"')
-        linked_abs_ids = {db.get_metadata(book_id).get('identifiers', {}).get('audiobookshelf_id') for book_id in all_book_ids}
+        linked_abs_ids = {identifiers.get('audiobookshelf_id') for identifiers in db.all_field_for('identifiers', all_book_ids).values()}
 
         # Filter and sort unlinked items
         unlinked_items = []
@@ -208,26 +255,30 @@ class AudiobookshelfAction(InterfaceAction):
         message = (f"Found {len(unlinked_items)} unlinked books in Audiobookshelf library.\n\n"
         "Double Click the title to open book in Audiobookshelf.")
         dialog = SyncCompletionDialog(self.gui, "Unlinked Audiobookshelf Books", message, unlinked_items, resultsColWidth=0, type="info")
-        table = dialog.table_area.findChild(QTableWidget)
-        def on_cell_double_clicked(row, col):
-            print(table.get_column_index("title"))
-            if col == 1:
-                open_url(f"{CONFIG['abs_url']}/audiobookshelf/item/{unlinked_items[table.item(row, 0).text()].get('hidden_id')}")
-        table.cellDoubleClicked.connect(on_cell_double_clicked)
+        def on_double_clicked(index):
+            if dialog.headers[index.column()] == 'title':
+                open_url(f"{CONFIG['abs_url']}/audiobookshelf/item/{unlinked_items[dialog.source_row(index)].get('hidden_id')}")
+        if unlinked_items:
+            dialog.table.doubleClicked.connect(on_double_clicked)
         dialog.show()
 
     def scheduled_sync(self):
         def scheduledTask():
-            QTimer.singleShot(24 * 3600 * 1000, scheduledTask)
             self.sync_from_audiobookshelf(silent = True if not DEBUG else False)
-        def main():
-            currentTime = QTime.currentTime()
-            targetTime = QTime(CONFIG.get('scheduleSyncHour', 4), CONFIG.get('scheduleSyncMinute', 0))
-            timeDiff = currentTime.msecsTo(targetTime)
-            if timeDiff < 0:
-                timeDiff += 86400000
-            QTimer.singleShot(timeDiff, scheduledTask)
-        main()
+        # A single repeating daily timer, started once the first scheduled sync runs
+        self.scheduledSyncTimer = QTimer(self)
+        self.scheduledSyncTimer.setTimerType(Qt.VeryCoarseTimer) # Second accuracy is plenty, lets the OS batch wakeups
+        self.scheduledSyncTimer.setInterval(24 * 3600 * 1000)
+        self.scheduledSyncTimer.timeout.connect(scheduledTask)
+        def firstTask():
+            self.scheduledSyncTimer.start()
+            scheduledTask()
+        currentTime = QTime.currentTime()
+        targetTime = QTime(CONFIG.get('scheduleSyncHour', 4), CONFIG.get('scheduleSyncMinute', 0))
+        timeDiff = currentTime.msecsTo(targetTime)
+        if timeDiff < 0:
+            timeDiff += 86400000
+        QTimer.singleShot(timeDiff, firstTask)
 
     def watcher(self, watched_columns):
         """Watch specified columns for changes and sync back to Audiobookshelf"""
@@ -290,25 +341,15 @@ class AudiobookshelfAction(InterfaceAction):
         api_key = CONFIG.get('abs_key', '')
         self.gui.add_db_listener(event_listener)
 
-    def update_metadata(self, book_uuid, keys_values_to_update):
-        db = self.gui.current_db.new_api
-        try:
-            book_id = db.lookup_by_uuid(book_uuid)
-        except Exception:
-            return False, {'error': f"Book not found: {book_uuid}"}
-        if not book_id:
-            return False, {'error': f"Book not found: {book_uuid}"}
-        metadata = db.get_metadata(book_id)
-        updates = []
-        for key, new_value in keys_values_to_update.items():
-            if isinstance(new_value, tuple):
-                metadata.set(key, new_value[0], extra=new_value[1])
-            else:
-                metadata.set(key, new_value)
-            updates.append(key)
-        if updates:
-            db.set_metadata(book_id, metadata, set_title=False, set_authors=False)
-        return True, {'updated': updates, 'book_id': book_id}
+    def update_metadata(self, db, field_updates):
+        """Write {field: {book_id: value}} with one set_field call per field. Returns {book_id: error} for failed writes."""
+        failed = {}
+        for field, book_id_map in field_updates.items():
+            try:
+                db.set_field(field, book_id_map)
+            except Exception as e:
+                failed.update(dict.fromkeys(book_id_map, f"Failed to update {field}: {e}"))
+        return failed
 
     def get_nested_value(self, data, path):
         for key in path:
@@ -320,43 +361,111 @@ class AudiobookshelfAction(InterfaceAction):
                 return None
         return data
 
+    def _acquire_connection(self, scheme, netloc):
+        """Reuse an idle keep-alive connection to the host if there is one, else open a new one."""
+        with self._http_lock:
+            idle = self._http_pool.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        conn_class = HTTPSConnection if scheme == 'https' else HTTPConnection
+        return conn_class(netloc, timeout=10), False
+
+    def _release_connection(self, scheme, netloc, conn):
+        with self._http_lock:
+            idle = self._http_pool.setdefault((scheme, netloc), [])
+            if len(idle) < 4:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear_api_cache(self):
+        with self._http_lock:
+            self._api_cache.clear()
+
+    def _http_request(self, url, method, data, headers):
+        """Send one request over a pooled connection. Returns (response, body), or None if the request failed."""
+        parsed = urllib.parse.urlsplit(url)
+        path = f"{parsed.path or '/'}?{parsed.query}" if parsed.query else (parsed.path or '/')
+        while True:
+            conn, reused = self._acquire_connection(parsed.scheme, parsed.netloc)
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                resp_data = response.read()
+                break
+            except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused: # A pooled connection may have been dropped by the server, retry once on a fresh one
+                    return None
+            except (HTTPException, OSError): # Includes timeouts, which are never retried
+                conn.close()
+                return None
+        if response.will_close:
+            conn.close()
+        else:
+            self._release_connection(parsed.scheme, parsed.netloc, conn)
+        return response, resp_data
+
     def api_request(self, url, api_key, body=None):
+        if body is None:
+            with self._http_lock:
+                cached = self._api_cache.get((url, api_key))
+                if cached and cached[0] <= time.monotonic(): # Stale, drop it so large payloads aren't kept around
+                    del self._api_cache[(url, api_key)]
+                    cached = None
+            if cached:
+                return cached[1]
         headers = {
             'Authorization': f'Bearer {api_key}',
             'Accept': 'application/json',
             'Content-Type': 'application/json',
             'User-Agent': f'CalibreAudiobookshelfSync/{self.version}',
         }
-        req = Request(url, headers=headers)
-        if body is not None:
-            req.method = body[0]
-            req.data = json.dumps(body[1]).encode("utf-8")
+        method, data = (body[0], json.dumps(body[1]).encode("utf-8")) if body is not None else ('GET', None)
+        request_url = url
+        for _ in range(5): # Follow GET redirects (e.g. http to https behind a reverse proxy) like urlopen did
+            result = self._http_request(request_url, method, data, headers)
+            if result is None:
+                print("API request failed")
+                return None
+            response, resp_data = result
+            if method == 'GET' and response.status in (301, 302, 303, 307, 308) and (location := response.getheader('Location')):
+                request_url = urllib.parse.urljoin(request_url, location)
+                continue
+            break
+        if not 200 <= response.status < 300:
+            print("API request failed")
+            return None
         try:
-            with urlopen(req, timeout=10) as response:
-                resp_data = response.read()
-                return json.loads(resp_data.decode('utf-8'))
-        except (HTTPError, URLError):
+            payload = json.loads(resp_data) # json accepts the raw UTF-8 bytes, no need for a decoded copy of the body
+        except ValueError:
             print("API request failed")
             return None
+        if body is None:
+            now = time.monotonic()
+            with self._http_lock:
+                # Prune expired responses from other URLs, e.g. a library items fetch from a previous sync
+                for key in [key for key, (expiry, _) in self._api_cache.items() if expiry <= now]:
+                    del self._api_cache[key]
+                self._api_cache[(url, api_key)] = (now + API_CACHE_TTL, payload)
+        else: # Writes change server state, so nothing cached is current anymore
+            self.clear_api_cache()
+        return payload
+
+    def get_sync_data(self, server_url, api_key, api_sources):
+        """Fetch and index everything a sync needs from Audiobookshelf. Returns (data, None) or (None, (error title, error message))."""
+        # Fetch user and session data in the background while the library items are retrieved
+        executor = ThreadPoolExecutor(max_workers=2)
+        if 'mediaProgress' in api_sources:
+            me_future = executor.submit(self.api_request, f"{server_url}/api/me", api_key)
+        if 'sessions' in api_sources:
+            sessions_future = executor.submit(self.api_request, f"{server_url}/api/me/listening-sessions?itemsPerPage=999999", api_key)
+        executor.shutdown(wait=False)
 
-    def sync_from_audiobookshelf(self, silent=False):
-        self.Syncing = True
-        server_url = CONFIG.get('abs_url', 'http://localhost:13378')
-        api_key = CONFIG.get('abs_key', '')
-        columns_to_sync = {k: {**v, 'column_name': CONFIG.get(k)} for k, v in COLUMNS.items() if CONFIG.get(k)}
-        api_sources = list({col_meta['api_source'] for col_meta in columns_to_sync.values()})
-
-        db = self.gui.current_db.new_api
-        all_book_ids = list(db.search('identifiers:"=audiobookshelf_id:"'))
-        if not all_book_ids:
-            show_info(self.gui, "No Linked Books", "Calibre library has no linked books, try using Quick Link or manually linking books.")
-            return
-
-        abs_items = self.get_abs_library_items()
+        abs_items = self.get_abs_library_items(silent=True)
         if abs_items is None:
-            show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf library data, "
+            return None, ("API Error", "Failed to retrieve Audiobookshelf library data, "
             "does user have library permissions or is Audiobookshelf empty?")
-            return
         # Build dictionary mapping item id to item data (from lib_items)
         items_dict = {}
         for item in abs_items:
@@ -365,14 +474,12 @@ class AudiobookshelfAction(InterfaceAction):
                 items_dict[item_id] = item
 
         # Get me data
+        media_progress_dict = {}
         if 'mediaProgress' in api_sources:
-            me_url = f"{server_url}/api/me"
-            me_data = self.api_request(me_url, api_key)
+            me_data = me_future.result()
             if me_data is None:
-                show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf user data.")
-                return
+                return None, ("API Error", "Failed to retrieve Audiobookshelf user data.")
             # Build dictionary mapping libraryItemId to media progress data (from mediaProgress)
-            media_progress_dict = {}
             for prog in me_data.get('mediaProgress', []):
                 media_progress_dict[prog.get('libraryItemId')] = {**prog, 'bookmarks': []}
             for bookmark in me_data.get('bookmarks'):
@@ -382,17 +489,20 @@ class AudiobookshelfAction(InterfaceAction):
                 })
 
         # Get collection/playlist data
+        collections_dict = {}
         if 'collections' in api_sources:
-            collections_dict = self.get_abs_collections(server_url, api_key)[0]
+            collections = self.get_abs_collections(server_url, api_key, silent=True)
+            if collections is None:
+                return None, ("API Error", "Failed to retrieve Audiobookshelf collections and playlists.")
+            collections_dict = collections[0]
 
         # Get session data
+        sessions_dict = {}
         if 'sessions' in api_sources:
-            sessions_response = self.api_request(f"{server_url}/api/me/listening-sessions?itemsPerPage=999999", api_key).get('sessions')
+            sessions_response = (sessions_future.result() or {}).get('sessions')
             if sessions_response is None:
-                show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf sessions.")
-                return
+                return None, ("API Error", "Failed to retrieve Audiobookshelf sessions.")
             else:
-                sessions_dict = {}
                 for session in sessions_response:
                     sessions_dict.setdefault(session["libraryItemId"], []).append({
                         "date": session["date"],
@@ -424,9 +534,47 @@ class AudiobookshelfAction(InterfaceAction):
                         'filtered_max_speed': max((s["sessionSpeed"] for s in filtered_sessions), default=None),
                     }
 
+        return {
+            'items_dict': items_dict,
+            'media_progress_dict': media_progress_dict,
+            'collections_dict': collections_dict,
+            'sessions_dict': sessions_dict,
+        }, None
+
+    def sync_from_audiobookshelf(self, silent=False):
+        # The fetch runs on the worker thread, so a manual or scheduled sync can arrive while one is still running
+        if self.Syncing:
+            if not silent:
+                show_info(self.gui, "Sync In Progress", "An Audiobookshelf sync is already running, please wait for it to finish.")
+            return
+        self.Syncing = True
+        server_url = CONFIG.get('abs_url', 'http://localhost:13378')
+        api_key = CONFIG.get('abs_key', '')
+        # Resolve the configured columns once here rather than for every book in the sync loop
+        active_cols = [
+            (column_name, col_meta['column_heading'], col_meta['datatype'], col_meta['api_source'],
+             nested_getter(col_meta.get('data_location', [])), col_meta['transform'] if callable(col_meta.get('transform')) else None)
+            for config_name, col_meta in COLUMNS.items()
+            if (column_name := CONFIG.get(config_name)) and col_meta['api_source'] in ('lib_items', 'mediaProgress', 'sessions', 'collections')
+        ]
+        api_sources = {api_source for _, _, _, api_source, _, _ in active_cols}
+        sync_Audible_ASIN = CONFIG.get('checkbox_enable_Audible_ASIN_sync', False)
+
+        db = self.gui.current_db.new_api
+        all_book_ids = list(db.search('identifiers:"=audiobookshelf_id:"'))
+        if not all_book_ids:
+            self.Syncing = False
+            show_info(self.gui, "No Linked Books", "Calibre library has no linked books, try using Quick Link or manually linking books.")
+            return
+        if not api_key:
+            self.Syncing = False
+            show_error(self.gui, "Configuration Error", "API Key not set in configuration.")
+            return
+
         class ABSSyncWorker(QThread):
             progress_update = pyqtSignal(int)
             finished_signal = pyqtSignal(dict)
+            error_signal = pyqtSignal(str, str)
 
             def __init__(self, action, db, book_ids):
                 super().__init__()
@@ -435,64 +583,91 @@ class AudiobookshelfAction(InterfaceAction):
                 self.book_ids = book_ids
 
             def run(self):
-                num_success = 0
-                num_fail = 0
+                # Exceptions don't reach calibre's error handler from this thread, so report them through error_signal
+                # which closes the progress dialog and clears Syncing
+                try:
+                    self.sync()
+                except Exception:
+                    self.error_signal.emit("Sync Error", f"Audiobookshelf sync failed:\n\n{traceback.format_exc()}")
+
+            def sync(self):
+                # Fetch Audiobookshelf data here rather than on the GUI thread
+                sync_data, error = self.action.get_sync_data(server_url, api_key, api_sources)
+                if error:
+                    self.error_signal.emit(*error)
+                    return
+                items_dict = sync_data['items_dict']
+                media_progress_dict = sync_data['media_progress_dict']
+                collections_dict = sync_data['collections_dict']
+                sessions_dict = sync_data['sessions_dict']
+
                 num_skip = 0
+                num_not_found = 0
                 results = []
-                for idx, book_id in enumerate(all_book_ids):
-                    metadata = db.get_metadata(book_id)
-                    book_uuid = metadata.get('uuid')
-                    identifiers = metadata.get('identifiers', {})
+                field_updates = {}
+                updated_results = {}
+                changed_headings = set() # Result table columns, collected as changes are found
+
+                # Read every field the loop needs in bulk instead of building a Metadata object per book
+                titles = self.db.all_field_for('title', self.book_ids)
+                identifiers_map = self.db.all_field_for('identifiers', self.book_ids)
+                old_values = {}
+                for column_name, _, datatype, _, _, _ in active_cols:
+                    lookup_names = (column_name, f'{column_name}_index') if datatype == 'series' else (column_name,)
+                    for lookup_name in lookup_names:
+                        if lookup_name in self.db.fields:
+                            # Multiple value fields come back as tuples, Metadata.get returned lists
+                            old_values[lookup_name] = {book_id: list(value) if isinstance(value, tuple) else value
+                                                       for book_id, value in self.db.all_field_for(lookup_name, self.book_ids).items()}
+
+                for idx, book_id in enumerate(self.book_ids):
+                    identifiers = dict(identifiers_map.get(book_id) or {})
                     abs_id = identifiers.get('audiobookshelf_id')
                     item_data = items_dict.get(abs_id)
                     if not item_data:
-                        results.append({'title': metadata.get('title', f'Book {book_id}'), 'error': 'Audiobookshelf item not found'})
+                        results.append({'title': titles.get(book_id) or f'Book {book_id}', 'error': 'Audiobookshelf item not found'})
                         num_skip += 1
+                        num_not_found += 1
                         continue
 
-                    result = {'title': metadata.get('title', f'Book {book_id}')}
-                    keys_values_to_update = {}
+                    result = {'title': titles.get(book_id) or f'Book {book_id}'}
+                    book_updated = False
 
                     # Update identifiers if Audible ASIN sync is enabled
-                    if CONFIG.get('checkbox_enable_Audible_ASIN_sync', False):
+                    if sync_Audible_ASIN:
                         current_Audible_ASIN = identifiers.get('audible')
                         Audible_ASIN = item_data.get('media').get('metadata').get('asin')
                         if Audible_ASIN != current_Audible_ASIN:
                             identifiers['audible'] = Audible_ASIN
-                            keys_values_to_update['identifiers'] = identifiers
-                            result['Audible ASIN'] = f"{current_Audible_ASIN if current_Audible_ASIN is not None else '-'} >> {Audible_ASIN}"
+                            field_updates.setdefault('identifiers', {})[book_id] = identifiers
+                            book_updated = True
+                            changed_headings.add('Audible ASIN')
+                            result['Audible ASIN'] = ValueChange(current_Audible_ASIN, Audible_ASIN)
 
                     # For each custom column, use api_source and data_location for lookup
-                    for col_meta in columns_to_sync.values():
-                        column_name = col_meta.get('column_name')
-                        data_location = col_meta.get('data_location', [])
-                        api_source = col_meta.get('api_source')
-                        value = None
-
-                        if api_source == "mediaProgress":
-                            value = self.action.get_nested_value(media_progress_dict.get(abs_id), data_location)
-                            if col_meta['column_heading'] == "Audiobook Started" and value is None:
+                    for column_name, column_heading, datatype, api_source, get_value, transform in active_cols:
+                        if api_source == "lib_items":
+                            value = get_value(item_data)
+                        elif api_source == "mediaProgress":
+                            value = get_value(media_progress_dict.get(abs_id))
+                            if column_heading == "Audiobook Started" and value is None:
                                 value = True
-                        elif api_source == "lib_items":
-                            value = self.action.get_nested_value(item_data, data_location)
                         elif api_source == "sessions":
-                            value = self.action.get_nested_value(sessions_dict.get(abs_id, {}), data_location)
-                        elif api_source == "collections":
+                            value = get_value(sessions_dict.get(abs_id, {}))
+                        else: # collections
                             value = collections_dict.get(abs_id, [])
-                        else:
-                            continue
 
                         if value is not None:
-                            if 'transform' in col_meta and callable(col_meta['transform']):
-                                value = col_meta['transform'](value)
+                            if transform is not None:
+                                value = transform(value)
                             if value is not None:
-                                old_value = metadata.get(column_name)
+                                old_value = old_values.get(column_name, {}).get(book_id)
                                 if type(old_value) != type(value):
                                     # Convert value to the same type as old_value
                                     if isinstance(old_value, str) and isinstance(value, list):
                                         value = ', '.join(value)
-                                    elif col_meta['datatype'] == 'series':
-                                        if old_value == value[0] and metadata.get(f'{column_name}_index') == value[1]:
+                                    elif datatype == 'series':
+                                        if old_value == value[0] and old_values.get(f'{column_name}_index', {}).get(book_id) == value[1]:
                                             value = old_value
                                     elif isinstance(old_value, bool):
                                         value = bool(value)
@@ -505,39 +680,57 @@ class AudiobookshelfAction(InterfaceAction):
                                 if isinstance(value, str):
                                     value = value.strip()
                                 if old_value != value:
-                                    keys_values_to_update[column_name] = value
+                                    if isinstance(value, tuple): # Series name and index
+                                        field_updates.setdefault(column_name, {})[book_id] = value[0]
+                                        field_updates.setdefault(f'{column_name}_index', {})[book_id] = value[1]
+                                    else:
+                                        field_updates.setdefault(column_name, {})[book_id] = value
+                                    book_updated = True
                                     # Only add to result if there's an actual change
-                                    result[col_meta['column_heading']] = f"{old_value if old_value is not None else '-'} >> {value}"
+                                    changed_headings.add(column_heading)
+                                    result[column_heading] = ValueChange(old_value, value)
 
-                    if keys_values_to_update:
-                        status, detail = self.action.update_metadata(book_uuid, keys_values_to_update)
-                        if status:
-                            num_success += 1
-                        else:
-                            num_fail += 1
-                            result['error'] = detail.get('error', 'Unknown error')
+                    if book_updated:
+                        updated_results[book_id] = result
                     else:
                         num_skip += 1
                     results.append(result)
                     self.progress_update.emit(idx + 1)
-                self.finished_signal.emit({'results': results, 'num_success': num_success, 'num_fail': num_fail, 'num_skip': num_skip})
+
+                # Write all changes at once, one set_field call per column instead of one set_metadata per book
+                failed = self.action.update_metadata(self.db, field_updates)
+                for book_id, error in failed.items():
+                    updated_results[book_id]['error'] = error
+                num_fail = len(failed)
+                num_success = len(updated_results) - num_fail
+                headers = ['title', *(['error'] if num_not_found or num_fail else []), *sorted(changed_headings)]
+                self.finished_signal.emit({'results': results, 'headers': headers, 'num_success': num_success, 'num_fail': num_fail, 'num_skip': num_skip, 'updated_ids': list(updated_results)})
 
         startTime = time.perf_counter()
         self.absSyncWorker = ABSSyncWorker(self, db, all_book_ids)
         progress_dialog = None
-        if not silent and len(all_book_ids)>25:
+        if not silent:
+            # Shown for every manual sync since the Audiobookshelf fetch can take a while even for a few books
             progress_dialog = ProgressDialog(self.gui, "Updating Metadata...", len(all_book_ids))
             progress_dialog.show()
             self.absSyncWorker.progress_update.connect(progress_dialog.setValue)
         def on_finished(res):
             self.Syncing = False
+            if res['updated_ids']:
+                self.gui.library_view.model().refresh_ids(res['updated_ids'])
             if not silent:
                 if progress_dialog:
                     progress_dialog.close()
                 message = (f"Total books processed: {len(res['results'])}\nUpdated: {res['num_success']}\nSkipped: {res['num_skip']}\nFailed: {res['num_fail']}\n\nTime taken: {time.perf_counter() - startTime:.6f} seconds.")
                 res['results'].sort(key=lambda row: (not row.get('error', False), -len(row), row['title'].lower())) # Sort by if error, # of changes, then title
-                SyncCompletionDialog(self.gui, "Sync Completed", message, res['results'], type="info").show()
+                SyncCompletionDialog(self.gui, "Sync Completed", message, res['results'], type="info", headers=res['headers']).show()
+        def on_error(title, message):
+            self.Syncing = False
+            if progress_dialog:
+                progress_dialog.close()
+            show_error(self.gui, title, message)
         self.absSyncWorker.finished_signal.connect(on_finished)
+        self.absSyncWorker.error_signal.connect(on_error)
         self.absSyncWorker.start()
 
     def audible_search(self, params):
@@ -556,25 +749,29 @@ class AudiobookshelfAction(InterfaceAction):
             show_error(self.gui, "Configuration Error", "Audible ASIN sync is not enabled but is required for this feature, please enable it in the configuration.")
             return
 
-        audible_cols = {col_lookup_name: COLUMNS[config_key]['data_location'] for config_key, col_lookup_name in CONFIG.items() if config_key.startswith('column_audible_') and col_lookup_name}
+        db = self.gui.current_db.new_api
+        # CONFIG is shared by every library, so skip configured columns that don't exist in this one
+        audible_cols = {col_lookup_name: COLUMNS[config_key]['data_location'] for config_key, col_lookup_name in CONFIG.items()
+                        if config_key.startswith('column_audible_') and col_lookup_name and col_lookup_name in db.fields}
         if not audible_cols:
             show_error(self.gui, "Configuration Error", "No Audible columns configured for syncing, please configure them in the plugin settings.")
             return
 
-        db = self.gui.current_db.new_api
         bookList = list(db.search('identifiers:"=audible:"'))
         if not bookList:
             show_info(self.gui, "No Linked Books/ASINs", "Calibre library has no linked books and/or ASINs, try using Quick Link or manually linking books and verify Audiobookshelf has ASINs filled in.")
             return
+        titles = db.all_field_for('title', bookList)
+        identifiers_map = db.all_field_for('identifiers', bookList)
+        current_values = {key: db.all_field_for(key, bookList) for key in audible_cols.keys()}
         bookList = [
             {
                 'book_id': book_id,
-                'metadata': metadata,
-                'ASIN': str(metadata.get('identifiers', {}).get('audible')),
-                'current_values': {key: metadata.get(key, '') for key in audible_cols.keys()}
+                'title': titles[book_id],
+                'ASIN': str(identifiers_map[book_id].get('audible')),
+                'current_values': {key: current_values[key][book_id] for key in audible_cols.keys()}
             }
             for book_id in bookList
-            if (metadata := db.get_metadata(book_id))
         ]
 
         # Query Audible API for ratings in chunks of 50 ASINs (API restriction). Save response data as dict keyed by ASIN
@@ -599,20 +796,25 @@ class AudiobookshelfAction(InterfaceAction):
 
             def run(self):
                 log = []
+                field_updates = {}
+                log_by_book_id = {}
                 for i, book in enumerate(bookList):
                     self.progress_update.emit(i)
                     if 'rating' not in audible_ratings.get(book['ASIN'], {}):
-                        log.append({'title': book['metadata'].get('title'), 'ASIN': book['ASIN'], 'error': 'No rating found'})
+                        log.append({'title': book['title'], 'ASIN': book['ASIN'], 'error': 'No rating found'})
                         continue
-                    log.append({'title': book['metadata'].get('title'), 'ASIN': book['ASIN']})
+                    log.append({'title': book['title'], 'ASIN': book['ASIN']})
+                    log_by_book_id[book['book_id']] = log[i]
                     for col_lookup_name, data_location in audible_cols.items():
                         new_value = self.action.get_nested_value(audible_ratings[book['ASIN']], data_location)
                         if isinstance(new_value, float): # Audible rating is a float, but we want to store it as an int*2 (for half rating) in calibre
                             new_value = int(new_value*2)
                         if new_value != book['current_values'][col_lookup_name]:
-                            book['metadata'].set(col_lookup_name, new_value)
-                            db.set_metadata(book['book_id'], book['metadata'], set_title=False, set_authors=False)
-                            log[i][col_lookup_name] = f"{book['current_values'][col_lookup_name] if book['current_values'][col_lookup_name] is not None else '-'} >> {new_value}"
+                            field_updates.setdefault(col_lookup_name, {})[book['book_id']] = new_value
+                            log[i][col_lookup_name] = ValueChange(book['current_values'][col_lookup_name], new_value)
+                for book_id, error in self.action.update_metadata(self.db, field_updates).items():
+                    log_by_book_id[book_id]['error'] = error
+                self.updated_ids = list({book_id for book_id_map in field_updates.values() for book_id in book_id_map})
                 self.finished_signal.emit(log)
 
         startTime = time.perf_counter()
@@ -625,6 +827,8 @@ class AudiobookshelfAction(InterfaceAction):
         def on_finished(log):
             if progress_dialog:
                 progress_dialog.close()
+            if self.audibleSyncWorker.updated_ids:
+                self.gui.library_view.model().refresh_ids(self.audibleSyncWorker.updated_ids)
             log.sort(key=lambda row: (not row.get('error', False), -len(row), row['title'].lower())) # Sort by if error, # of changes, then title
             SyncCompletionDialog(self.gui, 
                                     "Audible Ratings Updated",
@@ -649,7 +853,8 @@ class AudiobookshelfAction(InterfaceAction):
         if CONFIG.get('checkbox_cache_QuickLink_history', False):
             QLCache = JSONConfig('plugins/Audiobookshelf QL Cache.json')
             cacheList = QLCache.get('cache', [])
-            all_book_ids = [book_id for book_id in all_book_ids if book_id not in cacheList]
+            cached_ids = set(cacheList)
+            all_book_ids = [book_id for book_id in all_book_ids if book_id not in cached_ids]
             if not all_book_ids:
                 cacheList = [
                     {
@@ -667,16 +872,15 @@ class AudiobookshelfAction(InterfaceAction):
                                       "See below for a list of books that have failed to link.\n"
                                       "Press the Backspace or Delete key while row(s) are selected to try them again during the next QuickLink."),
                                      cacheList, resultsColWidth=0, type="warn")
-                table = dialog.table_area.findChild(QTableWidget)
+                table = dialog.table
                 def custom_key_press(event):
                     if event.key() == Qt.Key_Delete or event.key() == Qt.Key_Backspace:
-                        rows_to_remove = sorted({index.row() for index in table.selectedIndexes()}, reverse=True) # row index in descending order so the list doesn't shift meaningfully
-                        cache_to_remove = sorted({int(table.item(row, 0).text()) for row in rows_to_remove}, reverse=True) # same for cache items
-                        for row in rows_to_remove:
-                            table.removeRow(row)
-                        for item in cache_to_remove:
-                            cacheList.pop(item)
+                        # Removing from the model also removes from cacheList, descending order so the list doesn't shift meaningfully
+                        for row in sorted({dialog.source_row(index) for index in table.selectedIndexes()}, reverse=True):
+                            dialog.model.removeRow(row)
                         QLCache['cache'] = [item['hidden_book_id'] for item in cacheList]
+                    else:
+                        QTableView.keyPressEvent(table, event)
                 table.keyPressEvent = custom_key_press
                 dialog.show()
                 return
@@ -686,14 +890,27 @@ class AudiobookshelfAction(InterfaceAction):
             show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf library data, does user have library permissions or is Audiobookshelf empty?")
             return
 
-        # key of ASIN and value of list of dict with keys abs_id and abs_title
+        # ASINs held by a single ABS book map to a dict with keys abs_id and abs_title,
+        # ASINs shared by several ABS books are moved to abs_asin_dups and map to how many share it
         abs_asin_index = {}
+        abs_asin_dups = {}
         for item in abs_items:
-            abs_asin = item.get('media', {}).get('metadata', {}).get('asin')
-            abs_title = item.get('media', {}).get('metadata', {}).get('title', 'Unknown Title')
-            if abs_asin:
-                abs_asin_index.setdefault(abs_asin, []).append({'abs_id': item.get('id'), 'abs_title': abs_title})
-        abs_asin_set = set(abs_asin_index.keys())
+            metadata = item.get('media', {}).get('metadata', {})
+            abs_asin = metadata.get('asin')
+            if not abs_asin:
+                continue
+            if abs_asin in abs_asin_dups:
+                abs_asin_dups[abs_asin] += 1
+            elif abs_asin in abs_asin_index:
+                del abs_asin_index[abs_asin]
+                abs_asin_dups[abs_asin] = 2
+            else:
+                abs_asin_index[abs_asin] = {'abs_id': item.get('id'), 'abs_title': metadata.get('title', 'Unknown Title')}
+        abs_asin_set = abs_asin_index.keys() | abs_asin_dups.keys()
+        if not abs_asin_set: # Nothing could match, so don't search Audible for every unlinked book
+            show_info(self.gui, "No ASINs In Audiobookshelf", "None of the Audiobookshelf books have an ASIN, which QuickLink needs to match books. "
+            "Fill in ASINs in Audiobookshelf (e.g. with its Match feature) or link books manually.")
+            return
 
         class QuickLinkWorker(QThread):
             progress_update = pyqtSignal(int)
@@ -709,10 +926,13 @@ class AudiobookshelfAction(InterfaceAction):
                 num_matched = 0
                 num_failed = 0
                 results = []
+                # Read the fields needed in bulk instead of building a Metadata object per book
+                titles = self.db.all_field_for('title', self.book_ids)
+                authors_map = self.db.all_field_for('authors', self.book_ids)
+                identifiers_map = self.db.all_field_for('identifiers', self.book_ids)
                 for idx, book_id in enumerate(self.book_ids):
-                    metadata = self.db.get_metadata(book_id)
-                    title = metadata.get('title', 'None')
-                    authors = metadata.get('authors', [])
+                    title = titles.get(book_id)
+                    authors = authors_map.get(book_id) or ()
                     if title and authors and authors[0] != 'Unknown':
                         try:
                             response = self.action.audible_search({
@@ -725,47 +945,47 @@ class AudiobookshelfAction(InterfaceAction):
                             if asin_overlap:
                                 if len(asin_overlap) == 1:
                                     matched_asin = next(iter(asin_overlap))
-                                    abs_id_list = abs_asin_index.get(matched_asin)
-                                    if len(abs_id_list) == 1:
+                                    abs_match = abs_asin_index.get(matched_asin)
+                                    if abs_match:
                                         num_matched += 1
                                         results.append({
-                                            'title': metadata.get('title', f'Book {book_id}'),
-                                            'matched title': f"{abs_id_list[0]['abs_title']}",
+                                            'title': title or f'Book {book_id}',
+                                            'matched title': f"{abs_match['abs_title']}",
                                             'Link?': True,
                                             'hidden_book_id': book_id,
-                                            'hidden_abs_id': abs_id_list[0]['abs_id'],
-                                            'hidden_metadata': metadata,
+                                            'hidden_abs_id': abs_match['abs_id'],
+                                            'hidden_identifiers': identifiers_map.get(book_id) or {},
                                             **({'Audible Search Results': '\n'.join(item['title'] for item in response['products'])} if DEBUG else {})
                                         })
                                     else:
                                         num_failed += 1
                                         results.append({
-                                            'title': metadata.get('title', f'Book {book_id}'),
-                                            'error': f"{len(abs_id_list)} ABS books with same ASIN, manual match required"
+                                            'title': title or f'Book {book_id}',
+                                            'error': f"{abs_asin_dups[matched_asin]} ABS books with same ASIN, manual match required"
                                         })
                                 else:
                                     num_failed += 1
                                     results.append({
-                                        'title': metadata.get('title', f'Book {book_id}'),
+                                        'title': title or f'Book {book_id}',
                                         'error': f"{len(asin_overlap)} possible matches found, manual match required"
                                     })
                             else:
                                 num_failed += 1
                                 results.append({
-                                    'title': metadata.get('title', f'Book {book_id}'),
+                                    'title': title or f'Book {book_id}',
                                     'error': f"Audible search found {response['total_results']} books; {len(response['products'])} checked; none matched",
                                     'hidden_id_for_cache': book_id
                                 })
                         except Exception:
                             num_failed += 1
                             results.append({
-                                'title': metadata.get('title', f'Book {book_id}'),
+                                'title': title or f'Book {book_id}',
                                 'error': "Exception during Audible search"
                             })
                     else:
                         num_failed += 1
                         results.append({
-                            'title': metadata.get('title', f'Book {book_id}'),
+                            'title': title or f'Book {book_id}',
                             'error': "Calibre is missing title and/or author, which are required for QuickLink"
                         })
                     self.progress_update.emit(idx + 1)
@@ -790,35 +1010,44 @@ class AudiobookshelfAction(InterfaceAction):
                 message = f"Confirm Matches via Checkbox and Click ''Link Selected'' to Link Selected Matches.\nYou can double click the matched title to open up the book in Audiobookshelf."
             message += f"\nBooks matched: {res['num_matched']}\nBooks failed: {res['num_failed']}\n\nTime taken: {time.perf_counter() - startTime:.6f} seconds."
             res['results'].sort(key=lambda row: (not row.get('Link?', False), row['title'].lower())) # Sort by if linkable, then title
-            dialog = SyncCompletionDialog(self.gui, "Quick Link Results", message, res['results'], resultsColWidth=0, type="info")
-            table = dialog.table_area.findChild(QTableWidget)
-            def on_cell_double_clicked(row, col):
-                if col == 3 and (id := res['results'][table.item(row, 0).text()].get('hidden_abs_id')):
+            headers = ['title', 'error'] if res['num_matched'] == 0 else \
+                      ['Link?', 'title', 'matched title', *(['error'] if res['num_failed'] else []), *(['Audible Search Results'] if DEBUG else [])]
+            dialog = SyncCompletionDialog(self.gui, "Quick Link Results", message, res['results'], resultsColWidth=0, type="info", headers=headers)
+            def on_double_clicked(index):
+                if dialog.headers[index.column()] == 'matched title' and (id := res['results'][dialog.source_row(index)].get('hidden_abs_id')):
                     open_url(f"{CONFIG['abs_url']}/audiobookshelf/item/{id}")
-            table.cellDoubleClicked.connect(on_cell_double_clicked)
+            dialog.table.doubleClicked.connect(on_double_clicked)
             dialog.exec_()
             if hasattr(dialog, 'checked_rows'):
+                identifiers_map = {}
                 for idx in dialog.checked_rows:
-                    identifiers = res['results'][idx]['hidden_metadata'].get('identifiers', {})
+                    identifiers = dict(res['results'][idx]['hidden_identifiers'])
                     identifiers['audiobookshelf_id'] = res['results'][idx]['hidden_abs_id']
-                    res['results'][idx]['hidden_metadata'].set('identifiers', identifiers)
-                    db.set_metadata(res['results'][idx]['hidden_book_id'], res['results'][idx]['hidden_metadata'], set_title=False, set_authors=False)
+                    identifiers_map[res['results'][idx]['hidden_book_id']] = identifiers
+                if identifiers_map:
+                    failed = self.update_metadata(db, {'identifiers': identifiers_map})
+                    linked_ids = [book_id for book_id in identifiers_map if book_id not in failed]
+                    if linked_ids:
+                        self.gui.library_view.model().refresh_ids(linked_ids)
+                    if failed:
+                        show_error(self.gui, "Link Error", f"Failed to link {len(failed)} {'book' if len(failed) == 1 else 'books'}:\n\n" +
+                                   next(iter(failed.values())))
 
         self.quickLinkWorker.finished_signal.connect(on_finished)
         self.quickLinkWorker.start()
 
     def link_audiobookshelf_book(self):
-        abs_items = self.get_abs_library_items()
-        if abs_items is None:
-            show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf library data, "
-            "does user have library permissions or is Audiobookshelf empty?")
-            return
-
-        # Get me data
+        # Get me data in the background while the library items are retrieved
         server_url = CONFIG.get('abs_url', 'http://localhost:13378')
         api_key = CONFIG.get('abs_key', '')
-        me_url = f"{server_url}/api/me"
-        me_data = self.api_request(me_url, api_key)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            me_future = executor.submit(self.api_request, f"{server_url}/api/me", api_key)
+            abs_items = self.get_abs_library_items()
+            if abs_items is None:
+                show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf library data, "
+                "does user have library permissions or is Audiobookshelf empty?")
+                return
+            me_data = me_future.result()
 
         if me_data is None:
             show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf user data.")
@@ -900,13 +1129,14 @@ class AudiobookshelfAction(InterfaceAction):
                              f"{len(selected_ids)} {'book has' if len(selected_ids) == 1 else 'books have'} been unlinked from Audiobookshelf.", 
                              log, resultsColWidth=0, type="info").exec_()
 
-    def get_abs_library_items(self):
-        """Get all items from all Audiobookshelf libraries."""
+    def get_abs_library_items(self, silent=False):
+        """Get all items from all Audiobookshelf libraries. Pass silent=True when not on the GUI thread."""
         server_url = CONFIG.get('abs_url', 'http://localhost:13378')
         api_key = CONFIG.get('abs_key', '')
         
         if not api_key:
-            show_error(self.gui, "Configuration Error", "API Key not set in configuration.")
+            if not silent:
+                show_error(self.gui, "Configuration Error", "API Key not set in configuration.")
             return None
 
         # Get list of libraries
@@ -914,41 +1144,46 @@ class AudiobookshelfAction(InterfaceAction):
         libraries_response = self.api_request(libraries_url, api_key)
         
         if libraries_response is None:
-            show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf libraries.")
+            if not silent:
+                show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf libraries.")
             return None
 
         # Extract libraries list from response
         libraries_data = libraries_response.get('libraries', [])
         
+        # Skip non-audiobook libraries
+        book_libraries = [library for library in libraries_data if library.get('id') and library.get('mediaType') == 'book']
+
+        # Fetch the items of every library concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            libraries_items = list(executor.map(
+                lambda library: self.api_request(f"{server_url}/api/libraries/{library['id']}/items", api_key),
+                book_libraries
+            ))
+
         # Build complete items list from all libraries
         all_items = []
-        for library in libraries_data:
-            library_id = library.get('id')
+        for library, items_data in zip(book_libraries, libraries_items):
             library_name = library.get('name')
-            if not library_id:
-                continue
-            if library.get('mediaType') != 'book':
-                continue  # Skip non-audiobook libraries
-                
-            items_url = f"{server_url}/api/libraries/{library_id}/items"
-            items_data = self.api_request(items_url, api_key)
-            
             if items_data is None:
                 continue
                 
-            # Extract items from response and add library name
-            items_list = [{**item, 'libraryName': library_name} for item in items_data["results"]]
-                
+            # Extract items from response and tag each with its library name in place
+            items_list = items_data["results"]
+            for item in items_list:
+                item['libraryName'] = library_name
+
             all_items.extend(items_list)
         
         return all_items if all_items else None
 
-    def get_abs_collections(self, server_url, api_key):
+    def get_abs_collections(self, server_url, api_key, silent=False):
         collections_dict = {}
         collections_map = {}
         collections_data = self.api_request(f"{server_url}/api/collections", api_key)
         if collections_data is None:
-            show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf collections.")
+            if not silent:
+                show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf collections.")
             return
         for collection in collections_data.get("collections", []):
             collection_name = collection.get("name")
@@ -958,7 +1193,8 @@ class AudiobookshelfAction(InterfaceAction):
         
         playlists_data = self.api_request(f"{server_url}/api/playlists", api_key)
         if playlists_data is None:
-            show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf playlists.")
+            if not silent:
+                show_error(self.gui, "API Error", "Failed to retrieve Audiobookshelf playlists.")
             return
         for playlist in playlists_data.get("playlists", []):
             playlist_label = "PL " + playlist.get("name", "")
@@ -984,8 +1220,68 @@ class ProgressDialog(QDialog):
     def setValue(self, value: int):
         self.progressBar.setValue(value)
 
+class ResultsTableModel(QAbstractTableModel):
+    """Serves the results list to a QTableView on demand, so no per-cell items are built"""
+    def __init__(self, results, headers, parent=None):
+        super().__init__(parent)
+        self.results = results
+        self.headers = headers
+        self.header_labels = list(headers)
+        self.checked = {row for row, result in enumerate(results) if result.get('Link?', False)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, header = index.row(), self.headers[index.column()]
+        result = self.results[row]
+        if header == "Link?":
+            if not result.get(header, False):
+                return None
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self.checked else Qt.Unchecked
+            if role == Qt.ToolTipRole:
+                return 'Checked Box = Link, Unchecked Box = Skip'
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return str(result.get(header, ""))
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        if Qt.CheckState(value) == Qt.Checked:
+            self.checked.add(index.row())
+        else:
+            self.checked.discard(index.row())
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if self.headers[index.column()] == "Link?" and self.results[index.row()].get("Link?", False):
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.header_labels[section]
+        return super().headerData(section, orientation, role)
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.results[row:row + count]
+        self.checked = {r if r < row else r - count for r in self.checked if not row <= r < row + count}
+        self.endRemoveRows()
+        return True
+
 class SyncCompletionDialog(QDialog):
-    def __init__(self, parent=None, title="", msg="", results=None, resultsRowHeight=None, resultsColWidth=150, type=None):
+    def __init__(self, parent=None, title="", msg="", results=None, resultsRowHeight=None, resultsColWidth=150, type=None, headers=None):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setMinimumWidth(800)
@@ -1016,7 +1312,7 @@ class SyncCompletionDialog(QDialog):
         if results:
             self.table_area = QScrollArea(self)
             self.table_area.setWidgetResizable(True)
-            table = self.create_results_table(results, resultsRowHeight, resultsColWidth)
+            self.table = table = self.create_results_table(results, resultsRowHeight, resultsColWidth, headers)
             self.table_area.setWidget(table)
             layout.addWidget(self.table_area)
 
@@ -1027,7 +1323,7 @@ class SyncCompletionDialog(QDialog):
             copy_button.setFixedWidth(200)
             copy_button.setIcon(QIcon.ic('edit-copy.png'))
             copy_button.clicked.connect(lambda: (
-                QApplication.clipboard().setText(str(results)), 
+                QApplication.clipboard().setText(self.results_as_tsv()), 
                 copy_button.setText('Copied')
             ))
             bottomButtonLayout.addWidget(copy_button)
@@ -1037,66 +1333,47 @@ class SyncCompletionDialog(QDialog):
         ok_button.setIcon(QIcon.ic('ok.png'))
         ok_button.clicked.connect(self.accept)
         ok_button.setDefault(True)
-        if results and table.horizontalHeaderItem(1).text() == 'Link?':
+        if results and 'Link?' in self.headers:
             ok_button.setText('Link Selected')
             ok_button.setIcon(QIcon.ic('insert-link.png'))
             def link_callback():
-                self.checked_rows = []
-                for row in range(table.rowCount()):
-                    item = table.item(row, 1)
-                    if item and item.checkState() == Qt.Checked:
-                        self.checked_rows.append(row)
+                self.checked_rows = sorted(self.model.checked)
                 self.accept()
             ok_button.clicked.connect(link_callback)
         bottomButtonLayout.addWidget(ok_button)
         layout.addLayout(bottomButtonLayout)
     
-    def create_results_table(self, results, resultsRowHeight, resultsColWidth):
-        # Get all possible headers from results (ignoring hidden_ prefix) and save as set
-        all_headers = {key for result in results for key in result.keys() if not key.startswith('hidden_')}
-
-        # Organize headers: idx very left hidden, checkbox left for QL, title first, messages in middle, custom columns last
-        headers = ['idx', 'title']
-        custom_columns = sorted(h for h in all_headers 
-                               if h not in ('title', 'matched title', 'skipped', 'error', 'Link?'))
-        
-        if 'Link?' in all_headers:
-            headers.insert(1, 'Link?')
-        if 'matched title' in all_headers:
-            headers.append('matched title')
-        if 'skipped' in all_headers:
-            headers.append('skipped')
-        if 'error' in all_headers:
-            headers.append('error')
-        if custom_columns:
-            headers.extend(custom_columns)
-
-        table = QTableWidget()
-        table.setRowCount(len(results))
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.setColumnHidden(0, True) # Hide idx column
+    def create_results_table(self, results, resultsRowHeight, resultsColWidth, headers=None):
+        # Callers that already know their columns pass them in headers, otherwise collect them from every result
+        if headers is None:
+            # Get all possible headers from results (ignoring hidden_ prefix) and save as set
+            all_headers = {key for result in results for key in result.keys() if not key.startswith('hidden_')}
+
+            # Organize headers: checkbox left for QL, title first, messages in middle, custom columns last
+            headers = ['title']
+            custom_columns = sorted(h for h in all_headers 
+                                   if h not in ('title', 'matched title', 'skipped', 'error', 'Link?'))
+            
+            if 'Link?' in all_headers:
+                headers.insert(0, 'Link?')
+            if 'matched title' in all_headers:
+                headers.append('matched title')
+            if 'skipped' in all_headers:
+                headers.append('skipped')
+            if 'error' in all_headers:
+                headers.append('error')
+            if custom_columns:
+                headers.extend(custom_columns)
+
+        self.headers = headers
+        self.model = ResultsTableModel(results, headers, self)
+        # Sorting goes through a proxy so the model rows keep matching the results list
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        table = QTableView()
+        table.setModel(self.proxy_model)
         table.setSortingEnabled(True)
-
-        # Populate Table
-        for row, result in enumerate(results):
-            for col, header in enumerate(headers):
-                if header == "idx":
-                    item = QTableWidgetItem(str(row))
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    table.setItem(row, col, item)
-                elif header == "Link?" and result.get(header, False):
-                    item = QTableWidgetItem("")
-                    item.setFlags((item.flags() & ~Qt.ItemIsEditable) | Qt.ItemIsUserCheckable)
-                    item.setCheckState(Qt.Checked)
-                    item.setToolTip('Checked Box = Link, Unchecked Box = Skip')
-                    table.setItem(row, col, item)
-                else: # All other headers
-                    value = result.get(header, "")
-                    item = QTableWidgetItem(str(value))
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    item.setToolTip(str(value))
-                    table.setItem(row, col, item)
+        table.sortByColumn(-1, Qt.AscendingOrder) # Keep the callers' order until a header is clicked
 
         # Set minimum width for each column
         if resultsColWidth == 0:
@@ -1110,15 +1387,7 @@ class SyncCompletionDialog(QDialog):
                 table.setColumnWidth(col, resultsColWidth)
 
         if resultsRowHeight:
-            if resultsRowHeight == 0:
-                table.resizeRowsToContents()
-                # Enforce a maximum height of 50 for each row, default = 30
-                for row in range(len(results)):
-                    if table.rowHeight(row) > 50: 
-                        table.setRowHeight(row, 50)
-            else:
-                for row in range(len(results)):
-                    table.setRowHeight(row, resultsRowHeight)
+            table.verticalHeader().setDefaultSectionSize(resultsRowHeight)
 
         max_lines = 1
         for col, header in enumerate(headers):
@@ -1130,12 +1399,28 @@ class SyncCompletionDialog(QDialog):
                     line = word if ' ' in line else ''
             lines.append(line)
             max_lines = max(len(lines), max_lines)
-            wrapped = '\n'.join(lines)
-            table.setHorizontalHeaderItem(col, QTableWidgetItem(wrapped))
+            self.model.header_labels[col] = '\n'.join(lines)
+        self.model.headerDataChanged.emit(Qt.Horizontal, 0, len(headers) - 1)
         table.horizontalHeader().setFixedHeight(20 * max_lines) # Default = 20
 
         return table
 
+    def results_as_tsv(self):
+        """The table's columns for every result as tab separated text, which pastes cleanly into a spreadsheet"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, dialect='excel-tab')
+        writer.writerow(self.headers)
+        def cell(row, result, header):
+            if header == "Link?": # Copy the checkbox state the table shows, not the initial match flag
+                return ("Checked" if row in self.model.checked else "Unchecked") if result.get(header, False) else ""
+            return str(result.get(header, ""))
+        writer.writerows([cell(row, result, header) for header in self.headers] for row, result in enumerate(self.model.results))
+        return buffer.getvalue()
+
+    def source_row(self, index):
+        """Map a (possibly sorted) table index back to its row in results"""
+        return self.proxy_model.mapToSource(index).row()
+
 class LinkDialog(QDialog):
     def __init__(self, parent, items, calibre_metadata=None, me_data=None):
         super().__init__(parent)
@@ -1164,10 +1449,18 @@ class LinkDialog(QDialog):
         book_label = QLabel(book_label_text)
         book_label.setWordWrap(True)
         layout.addWidget(book_label)
+
+        # Pull the fields used below out of the nested item dicts once, as parallel lists indexed like items
+        item_metadata = [item.get('media', {}).get('metadata', {}) for item in items]
+        titles = [metadata.get('title') or '' for metadata in item_metadata]
+        authors = [metadata.get('authorName') or '' for metadata in item_metadata]
+        titles_lower = [title.lower() for title in titles]
+        authors_lower = [author.lower() for author in authors]
+        ids = [item.get('id') for item in items]
+
         if (linked_book_id := calibre_metadata.get('identifiers', {}).get('audiobookshelf_id')) is not None:
             linked_book_title = next(
-                (item.get('media', {}).get('metadata', {}).get('title', '')
-                for item in items if item.get('id') == linked_book_id),
+                (titles[k] for k, item_id in enumerate(ids) if item_id == linked_book_id),
                 "Unknown Title"
             )
             already_linked_label = QLabel(f'<span style="color:red">This book is already linked to Audiobookshelf item <b>{linked_book_title}</b>.</span>')
@@ -1183,64 +1476,65 @@ class LinkDialog(QDialog):
             calibre_authors = [calibre_authors]
         calibre_authors = [author.lower() for author in calibre_authors]
 
-        # Sort items - matched items first, then alphabetically by title
-        def sort_key(item):
-            metadata = item.get('media', {}).get('metadata', {})
-            abs_title = metadata.get('title', '').lower()
-            abs_author = metadata.get('authorName', '').lower()
-
-            # Calculate match score: 2 for title+author match, 1 for either match, 0 for no match
-            score = 0
-            if abs_title == calibre_title:
-                score += 1
-            if abs_author in calibre_authors:
-                score += 1
-            if linked_book_id is not None and abs_title == linked_book_title.lower():
-                score += 5  # Boost score for already linked book
-
-            # Return tuple: (negative score for reverse sort, title for alphabetical)
-            return (-score, abs_title)
+        # Calculate match score: 2 for title+author match, 1 for either match, 0 for no match
+        title_matches = [title == calibre_title for title in titles_lower]
+        author_matches = [author in calibre_authors for author in authors_lower]
+        linked_title = linked_book_title.lower() if linked_book_id is not None else None
+        scores = [title_matches[k] + author_matches[k] + (5 if titles_lower[k] == linked_title else 0) # Boost score for already linked book
+                  for k in range(len(items))]
 
-        sorted_items = sorted(items, key=sort_key)
-        self.items = sorted_items  # Update items list with sorted version
+        # Sort items - matched items first, then alphabetically by title
+        order = sorted(range(len(items)), key=lambda k: (-scores[k], titles_lower[k]))
+        self.items = [items[k] for k in order]  # Update items list with sorted version
+
+        # Lowercased titles in row order, and the (start, end) row range of each score group which are each sorted by title
+        self.row_titles = [titles_lower[k] for k in order]
+        self.row_groups = []
+        row = 0
+        for _, group in groupby(order, key=lambda k: scores[k]):
+            size = sum(1 for _ in group)
+            self.row_groups.append((row, row + size))
+            row += size
 
         # Create a light blue color for highlighting
         highlight_color = QColor(173, 216, 230)  # Light blue RGB values
+        text_color = QColor(0, 0, 0)
+        no_edit_flags = QTableWidgetItem().flags() & ~Qt.ItemIsEditable
+        reading_icon = QIcon.ic('ok.png')
 
         # Get list of library item IDs from me_data
         reading_ids = set()
         if me_data and 'mediaProgress' in me_data:
             reading_ids = {prog.get('libraryItemId') for prog in me_data['mediaProgress'] if prog.get('libraryItemId')}
 
-        for row, item in enumerate(sorted_items):
-            metadata = item.get('media', {}).get('metadata', {})
-            abs_title = metadata.get('title', '')
-            abs_author = metadata.get('authorName', '')
-
+        # Don't repaint or re-sort the table while it is being filled
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        for row, k in enumerate(order):
             # Create title item
-            title_item = QTableWidgetItem(abs_title)
-            title_item.setFlags(title_item.flags() & ~Qt.ItemIsEditable)
-            if abs_title.lower() == calibre_title:
+            title_item = QTableWidgetItem(titles[k])
+            title_item.setFlags(no_edit_flags)
+            if title_matches[k]:
                 title_item.setBackground(highlight_color)
-                title_item.setForeground(QColor(0, 0, 0))  # Force black text
+                title_item.setForeground(text_color)  # Force black text
             self.table.setItem(row, 0, title_item)
 
             # Create author item  
-            author_item = QTableWidgetItem(abs_author)
-            author_item.setFlags(author_item.flags() & ~Qt.ItemIsEditable)
-            if abs_author.lower() in calibre_authors:
+            author_item = QTableWidgetItem(authors[k])
+            author_item.setFlags(no_edit_flags)
+            if author_matches[k]:
                 author_item.setBackground(highlight_color)
-                author_item.setForeground(QColor(0, 0, 0))  # Force black text
+                author_item.setForeground(text_color)  # Force black text
             self.table.setItem(row, 1, author_item)
 
             # Create reading status item
             status_item = QTableWidgetItem()
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            if item.get('id') in reading_ids:
-                status_item.setIcon(QIcon.ic('ok.png'))
+            status_item.setFlags(no_edit_flags)
+            if ids[k] in reading_ids:
+                status_item.setIcon(reading_icon)
             self.table.setItem(row, 2, status_item)
+        self.table.setUpdatesEnabled(True)
 
-        self.table.resizeColumnsToContents()
         self.table.setColumnWidth(0, 300)
         self.table.setColumnWidth(1, 300)
         self.table.setColumnWidth(2, 100)
@@ -1267,9 +1561,10 @@ class LinkDialog(QDialog):
         # Type a letter to jump to the row with a title starting with that letter.
         key = event.text().lower()
         if key:
-            for i in range(self.table.rowCount()):
-                item = self.table.item(i, 0)
-                if item and item.text().lower().startswith(key):
+            # Binary search each alphabetical score group, top group first
+            for start, end in self.row_groups:
+                i = bisect_left(self.row_titles, key, start, end)
+                if i < end and self.row_titles[i].startswith(key):
                     self.table.selectRow(i)
                     break
         super().keyPressEvent(event)
@@ -808,6 +808,7 @@ class ConfigWidget(QWidget):
             print('Could not add identifer link rule for Audible')  
 
         debug_print('new CONFIG = ', CONFIG)
+        self.action.clear_api_cache()
         if needRestart and show_restart_warning('Changes have been made that require a restart to take effect.\nRestart now?'):
             self.action.gui.quit(restart=True)
 